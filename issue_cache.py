@@ -0,0 +1,158 @@
+"""
+Persistent cache of fetched JIRA issues
+
+Stores each project's raw issues under ~/.cache/jira_automation/issues/<project>.json
+together with the newest `updated` timestamp seen, so later runs only need
+to ask JIRA for issues updated since then and can merge them by key.
+Callers are responsible for pruning issues that no longer match the JQL.
+The ETag of each such incremental query is kept as well, so an unchanged
+result can be confirmed with a conditional request.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jira_automation", "issues")
+
+# JIRA timestamp format, e.g. 2025-07-15T10:22:33.000-0400
+JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# JQL compares dates in the user's JIRA time zone at minute resolution, so the
+# incremental cursor is moved back far enough to cover any time zone offset;
+# re-fetched issues are simply merged again by key
+CURSOR_MARGIN = timedelta(days=1)
+
+
+class IssueCache:
+    """
+    Per-project JSON cache of raw JIRA issues
+
+    A cache entry is only valid for the JQL it was fetched with; changing
+    JIRA_JQL triggers a full fetch.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            directory: Directory holding one JSON file per project
+        """
+        self.directory = directory
+        self._etag_path = os.path.join(directory, ".etags.json")
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, project_name: str) -> str:
+        """Return the cache file path for a project"""
+        safe_name = re.sub(r"[^\w.-]+", "_", project_name)
+        return os.path.join(self.directory, f"{safe_name}.json")
+
+    def load(self, project_name: str, jql: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a project's cached issues
+
+        Args:
+            project_name: Name of the JIRA project
+            jql: JQL filter the issues must have been fetched with
+
+        Returns:
+            Dictionary with "last_updated" (None if the project had no
+            issues) and "issues" (issue key -> raw issue), or None if there
+            is no usable cache entry
+        """
+        try:
+            with open(self._path(project_name), "rb") as f:
+                data = orjson.loads(f.read()) if orjson else json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("jql") != jql:
+            return None
+        return data
+
+    def save(self, project_name: str, jql: str, issues: Dict[str, Dict[str, Any]]):
+        """
+        Store a project's issues
+
+        Args:
+            project_name: Name of the JIRA project
+            jql: JQL filter the issues were fetched with
+            issues: Raw JIRA issues keyed by issue key
+        """
+        updated = [issue.get("fields", {}).get("updated") for issue in issues.values()]
+        updated = [value for value in updated if value]
+        data = {
+            "jql": jql,
+            "last_updated": max(updated, key=_parse_timestamp) if updated else None,
+            "issues": issues,
+        }
+        path = self._path(project_name)
+        with open(path, "wb") as f:
+            if orjson:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(data, indent=2).encode("utf-8"))
+
+    def _load_etags(self) -> Dict[str, str]:
+        """Load the stored query -> ETag mapping"""
+        try:
+            with open(self._etag_path, "rb") as f:
+                return orjson.loads(f.read()) if orjson else json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load_etag(self, jql: str) -> Optional[str]:
+        """
+        Look up the ETag JIRA returned for a query
+
+        Args:
+            jql: Exact JQL of the search
+
+        Returns:
+            The stored ETag, or None if the query has not been seen
+        """
+        return self._load_etags().get(jql)
+
+    def save_etag(self, jql: str, etag: str):
+        """
+        Store the ETag JIRA returned for a query
+
+        Only ETags of the queries built from the current cache cursors are
+        kept; older queries can no longer be issued.
+
+        Args:
+            jql: Exact JQL of the search
+            etag: Value of the response's ETag header
+        """
+        with open(self._etag_path, "wb") as f:
+            data = {jql: etag}
+            f.write(orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8"))
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a JIRA timestamp"""
+    return datetime.strptime(value, JIRA_TIMESTAMP_FORMAT)
+
+
+def jql_cursor(timestamps: List[Optional[str]]) -> Optional[str]:
+    """
+    Build the JQL date for an incremental `updated >=` clause
+
+    Args:
+        timestamps: JIRA `updated` timestamps of the cached projects; None
+            for projects without cached issues
+
+    Returns:
+        The earliest timestamp minus CURSOR_MARGIN formatted for JQL, or
+        None if no project has a timestamp
+    """
+    parsed = [_parse_timestamp(value) for value in timestamps if value]
+    if not parsed:
+        return None
+    earliest = min(parsed)
+    return (earliest - CURSOR_MARGIN).strftime("%Y-%m-%d %H:%M")
@@ -9,12 +9,38 @@ Date: July 2025
 """
 
 import os
+import argparse
+import logging
 import requests
 import json
+import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+import queue
+import heapq
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 from datetime import datetime
+from pathlib import Path
+from itertools import chain
+from operator import itemgetter
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Compact JSON encoding, matching orjson.dumps"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+from issue_cache import IssueCache, jql_cursor
+from llm_cache import (PromptCache, SemanticCache, SEMANTIC_CACHE_AVAILABLE, DEFAULT_CACHE_DIR, DEFAULT_TTL,
+                       DEFAULT_SIMILARITY_THRESHOLD)
 
 # Load environment variables
 load_dotenv()
@@ -24,6 +50,68 @@ JIRA_TOKEN = os.getenv("JIRA_TOKEN")
 JIRA_URL = os.getenv("JIRA_URL")
 JQL = os.getenv("JIRA_JQL")
 OLLAMA_URL = "http://localhost:11434/api/generate"
+OLLAMA_MODEL = "llama3"
+# Deterministic sampling keeps responses stable and therefore cacheable;
+# num_predict/stop bound how long the model can keep generating
+OLLAMA_SUMMARY_OPTIONS = {"temperature": 0, "num_predict": 512, "stop": ["```", "\n\n\n"]}
+# Stop sequences are dropped from the output, so "]" cannot be one here;
+# the stream is instead closed once the JSON array is complete
+OLLAMA_DELIVERABLE_OPTIONS = {"temperature": 0, "num_predict": 2048, "stop": ["```", "\n\n\n"]}
+# Fixed part of the project summary prompt; the formatted issues are appended
+_SUMMARY_PROMPT_PREFIX = (
+    "You are a project manager assistant. Given a list of JIRA issues or tasks with the fields: "
+    "Issue Type, Issue Key, Summary, and Status, create a concise and professional high-level summary "
+    "of completed, planned for this specific project in the current or upcoming month. "
+    "The overall summary should be limited to 150 words. "
+    "Do not include any specific issue keys in your summary. "
+    "Do not list individual issues. No explanation needed—just the summary.\n\n"
+    "Here is the list of issues for this project: "
+)
+# Reduce step for projects whose issue list is summarized in chunks
+_COMBINE_PROMPT_PREFIX = (
+    "You are a project manager assistant. The following are partial summaries of the JIRA issues "
+    "of one project. Combine them into a single concise and professional high-level summary "
+    "of completed, planned for this specific project in the current or upcoming month. "
+    "The overall summary should be limited to 150 words. "
+    "Do not include any specific issue keys in your summary. "
+    "Do not list individual issues. No explanation needed—just the summary.\n\n"
+    "Here are the partial summaries:\n"
+)
+# Root directory for the LLM response and JIRA issue caches
+CACHE_DIR = os.getenv("JIRA_AUTOMATION_CACHE_DIR", DEFAULT_CACHE_DIR)
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", DEFAULT_TTL))
+# Opt-in: reuse responses for near-identical prompts (needs sentence-transformers + faiss-cpu)
+LLM_SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+LLM_SEMANTIC_THRESHOLD = float(os.getenv("LLM_SEMANTIC_THRESHOLD", DEFAULT_SIMILARITY_THRESHOLD))
+
+# Report path; a timestamp is appended to the stem when saving
+DEFAULT_REPORT_PATH = Path("JIRA_Summary_Report.docx")
+
+# Issues requested per JIRA search page (the server may cap this lower)
+JIRA_PAGE_SIZE = int(os.getenv("JIRA_PAGE_SIZE", 1000))
+
+# Most recently updated issues included in a project's summary prompt; the
+# summary is high-level, and prompt length drives Ollama latency
+SUMMARY_MAX_ISSUES = int(os.getenv("SUMMARY_MAX_ISSUES", 200))
+
+# Issue lists longer than this many characters are summarized chunk by chunk
+# and the partial summaries combined, keeping each prompt within the model context
+SUMMARY_CHUNK_CHARS = int(os.getenv("SUMMARY_CHUNK_CHARS", 6000))
+
+# Issue keys per `key in (...)` search; the JQL travels in the URL
+JQL_KEY_BATCH = 100
+
+# Connection pool size per HTTP session
+POOL_SIZE = 16
+
+# Upper bound on concurrent per-project workers (JIRA/Ollama calls are I/O-bound)
+MAX_WORKERS = 8
+
+# Concurrent Ollama generations; a single-GPU backend only queues requests
+# beyond its own parallelism, so JIRA work keeps MAX_WORKERS but the LLM does not
+OLLAMA_CONCURRENCY = max(1, int(os.getenv("OLLAMA_CONCURRENCY", 2)))
+
+log = logging.getLogger(__name__)
 
 
 JIRA_Project_Name_Mapping={
@@ -38,6 +126,315 @@ JIRA_Project_Name_Mapping={
     "Population Science Data Commons": "POPSCI",
     "Clinical and Translational Data Commons": "CTDC",
 }
+# Every key produced by _process_issues, read as one tuple per issue
+ISSUE_KEYS = ("issue type", "issue key", "summary", "status", "created", "updated", "duedate", "priority")
+ISSUE_COLS = itemgetter(*ISSUE_KEYS)
+
+# Issues the deliverable prompt asks the model to keep: closed stories, epics,
+# tasks and features (not bugs or sub-tasks)
+_DELIVERABLE_TYPE_RE = re.compile(r"story|epic|feature|(?<!sub)(?<!sub-)task", re.IGNORECASE)
+# Whole words only, so "Incomplete", "Unresolved" and "Not Done" stay open
+_CLOSED_STATUS_RE = re.compile(r"(?<!not )(?<!not-)\b(?:closed?|done|resolved|completed?)\b", re.IGNORECASE)
+
+# Issue types the rule-based fallback treats as deliverables
+_DELIV_RE = re.compile(r"story|epic|task|deliverable|feature", re.IGNORECASE)
+
+# Projects with at most this many candidate deliverables skip the LLM
+MAX_DELIVERABLES_WITHOUT_AI = 3
+
+# Header rows of the report tables
+ISSUE_TABLE_HEADERS = ("Issue Type", "Issue Key", "Summary", "Status")
+DELIVERABLE_TABLE_HEADERS = ("Subproject", "Deliverable Name", "Due Date", "Date Updated", "Status")
+
+# Placeholder values passed through _format_date unchanged
+_DATE_SENTINELS = frozenset({"Unknown", "No due date"})
+
+# Issue fields included in the summary prompt, in prompt order, and the
+# line template they are formatted with
+_SUMMARY_FIELDS = itemgetter("issue key", "summary", "status", "created", "updated", "duedate", "priority")
+_ISSUE_TMPL = (
+    "Issue Key: {}, Summary: {}, Status: {}, Created: {}, Updated: {}, Due Date: {}, Priority: {}"
+).format
+
+# Shared stand-ins for missing (or null) name objects in JIRA issue fields
+_UNK = {"name": "Unknown"}
+_NONE = {"name": "None"}
+
+
+def _extract_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a raw JIRA issue into a dictionary with all ISSUE_KEYS keys
+    
+    Args:
+        issue: Raw issue from the JIRA search API
+        
+    Returns:
+        Issue dictionary with placeholder values for missing fields
+    """
+    fields = issue.get("fields") or {}
+    issue_type = fields.get("issuetype") or _UNK
+    status = fields.get("status") or _UNK
+    priority = fields.get("priority") or _NONE
+    # JIRA sends unset fields as null, so placeholders apply to falsy values too
+    return {
+        "issue type": issue_type.get("name") or "Unknown",
+        "issue key": issue.get("key") or "No key",
+        "summary": fields.get("summary") or "No summary",
+        "status": status.get("name") or "Unknown",
+        "created": fields.get("created") or "Unknown",
+        "updated": fields.get("updated") or "Unknown",
+        "duedate": fields.get("duedate") or "No due date",
+        "priority": priority.get("name") or "None",
+    }
+
+
+def _chunk_lines(lines: Iterable[str], max_chars: int) -> Iterable[str]:
+    """
+    Group lines into newline-joined chunks of at most max_chars characters
+    
+    A single line longer than max_chars forms a chunk of its own.
+    
+    Args:
+        lines: Lines to group, in order
+        max_chars: Maximum chunk length, not counting the joining newlines
+        
+    Yields:
+        Chunks of consecutive lines
+    """
+    buffer = []
+    size = 0
+    for line in lines:
+        if buffer and size + len(line) > max_chars:
+            yield "\n".join(buffer)
+            buffer = []
+            size = 0
+        buffer.append(line)
+        size += len(line)
+    if buffer:
+        yield "\n".join(buffer)
+
+
+def _issue_columns(issue_summaries: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Transpose normalized issue dictionaries into one list per ISSUE_KEYS key
+    
+    Args:
+        issue_summaries: Issue dictionaries produced by _process_issues
+        
+    Returns:
+        Dictionary with issue keys as keys and column value lists as values
+    """
+    if not issue_summaries:
+        return {key: [] for key in ISSUE_KEYS}
+    return dict(zip(ISSUE_KEYS, map(list, zip(*map(ISSUE_COLS, issue_summaries)))))
+
+
+_W_TR = qn("w:tr")
+_W_TC = qn("w:tc")
+_W_TCPR = qn("w:tcPr")
+_W_TCW = qn("w:tcW")
+_W_P = qn("w:p")
+_W_R = qn("w:r")
+_W_T = qn("w:t")
+_W_W = qn("w:w")
+_W_TYPE = qn("w:type")
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def _append_table_rows(table, rows: Iterable[Sequence[Any]]):
+    """
+    Append rows to a python-docx table by building the row XML directly
+    
+    Avoids python-docx's per-cell object construction, which dominates
+    the cost of large tables. Cell widths follow the table grid.
+    
+    Args:
+        table: python-docx Table to extend
+        rows: Row values; each row must have one value per table column
+    """
+    tbl = table._tbl
+    widths = [grid_col.get(_W_W) for grid_col in tbl.tblGrid.findall(qn("w:gridCol"))]
+    
+    for values in rows:
+        tr = etree.SubElement(tbl, _W_TR)
+        for width, value in zip(widths, values):
+            tc = etree.SubElement(tr, _W_TC)
+            if width is not None:
+                tc_w = etree.SubElement(etree.SubElement(tc, _W_TCPR), _W_TCW)
+                tc_w.set(_W_W, width)
+                tc_w.set(_W_TYPE, "dxa")
+            p = etree.SubElement(tc, _W_P)
+            text = "" if value is None else str(value)
+            if text:
+                t = etree.SubElement(etree.SubElement(p, _W_R), _W_T)
+                t.text = text
+                if text != text.strip():
+                    t.set(_XML_SPACE, "preserve")
+
+
+class _JsonArrayScanner:
+    """
+    Incrementally detects when the first top-level JSON array is complete
+    
+    Text before the opening bracket is ignored; brackets inside JSON strings
+    are not counted.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+    
+    def feed(self, text: str) -> Optional[int]:
+        """
+        Consume more text
+        
+        Returns:
+            Index in text of the bracket closing the array, or None if the
+            array is not complete yet
+        """
+        for index, char in enumerate(text):
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                    self.depth = 1
+                continue
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "[":
+                self.depth += 1
+            elif char == "]":
+                self.depth -= 1
+                if self.depth == 0:
+                    return index
+        return None
+
+
+def _extract_first_json_array(text: str) -> Optional[str]:
+    """
+    Return the first balanced top-level JSON array in text
+    
+    Unlike slicing between the first '[' and the last ']', this ignores
+    any later arrays or trailing prose containing brackets.
+    
+    Args:
+        text: Text that may contain a JSON array
+        
+    Returns:
+        The array's source text, or None if no complete array is found
+    """
+    start = text.find("[")
+    if start == -1:
+        return None
+    end = _JsonArrayScanner().feed(text)
+    if end is None:
+        return None
+    return text[start:end + 1]
+
+
+# Queue sentinels telling the report writer whether all projects finished
+_REPORT_DONE = object()
+_REPORT_ABORTED = object()
+
+# requests.Session is not guaranteed thread-safe, so each worker gets its own
+_thread_local = threading.local()
+
+# Held for the duration of each Ollama request
+_ollama_slots = threading.BoundedSemaphore(OLLAMA_CONCURRENCY)
+
+
+def _get_session() -> requests.Session:
+    """
+    HTTP session for the current thread
+    
+    Sessions keep connections alive across calls so repeated JIRA and
+    Ollama requests skip the TCP/TLS handshake.
+    
+    Returns:
+        Pooled requests.Session owned by the calling thread
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return session
+
+
+@lru_cache(maxsize=256)
+def _ollama_generate(prompt: str, model: str = OLLAMA_MODEL, stop_at_json_array: bool = False) -> str:
+    """
+    Generate a completion with Ollama, streaming the response
+    
+    Results are memoized per process, so identical prompts (for example
+    from projects with the same issues) are only generated once per run.
+    Failed requests raise and are therefore not memoized. At most
+    OLLAMA_CONCURRENCY requests are in flight at a time.
+    
+    Args:
+        prompt: Prompt text
+        model: Ollama model name
+        stop_at_json_array: The answer is a JSON array; close the stream as
+            soon as the first top-level array is complete
+        
+    Returns:
+        The generated text, stripped of surrounding whitespace
+        
+    Raises:
+        Exception: If Ollama responds with an error status, reports an
+            error in the stream, or the stream ends before the final chunk
+    """
+    body = {
+        "model": model,
+        "prompt": prompt,
+        "stream": True,
+        "options": OLLAMA_DELIVERABLE_OPTIONS if stop_at_json_array else OLLAMA_SUMMARY_OPTIONS
+    }
+    headers = {"Content-Type": "application/json"}
+    chunks = []
+    scanner = _JsonArrayScanner() if stop_at_json_array else None
+    
+    with _ollama_slots, _get_session().post(OLLAMA_URL, data=_json_dumps(body), headers=headers,
+                                            stream=True) as response:
+        if response.status_code != 200:
+            log.error("Ollama API error: %s - %s", response.status_code, response.text)
+            raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+        
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = _json_loads(line)
+            if "error" in chunk:
+                # Errors after the stream has started arrive as a chunk of
+                # an otherwise successful response
+                log.error("Ollama stream error: %s", chunk["error"])
+                raise Exception(f"Ollama stream error: {chunk['error']}")
+            text = chunk.get("response", "")
+            chunks.append(text)
+            if chunk.get("done") or (scanner is not None and scanner.feed(text) is not None):
+                break
+        else:
+            # Raising keeps a truncated answer out of the memo and the prompt caches
+            log.error("Ollama stream ended without a final chunk")
+            raise Exception("Ollama stream ended without a final chunk; the response is truncated")
+    
+    return "".join(chunks).strip()
+
+
 class JiraToDocxAutomation:
     """
     Main automation class for JIRA to DOCX reporting
@@ -49,15 +446,44 @@ class JiraToDocxAutomation:
     - Word document generation
     """
     
-    def __init__(self, project_names: List[str]):
+    def __init__(self, project_names: List[str], use_cache: bool = True):
         """
         Initialize the automation with project names
         
         Args:
             project_names: List of JIRA project names to process
+            use_cache: Reuse cached Ollama responses for identical prompts and
+                fetch only recently updated JIRA issues on top of cached ones
         """
         self.validate_config()
-        self.project_names = project_names if isinstance(project_names, list) else [project_names]
+        project_names = project_names if isinstance(project_names, list) else [project_names]
+        # JIRA matches project names case-insensitively; each project is
+        # reported once, in the order first listed
+        unique_names = {}
+        for project_name in project_names:
+            unique_names.setdefault(project_name.lower(), project_name)
+        self.project_names = list(unique_names.values())
+        self._jira_headers = {
+            "Authorization": f"Bearer {JIRA_TOKEN}",
+            "Accept": "application/json",
+        }
+        self.llm_cache = PromptCache(os.path.join(CACHE_DIR, "llm_cache.sqlite3"), ttl=LLM_CACHE_TTL) if use_cache else None
+        self.issue_cache = IssueCache(os.path.join(CACHE_DIR, "issues")) if use_cache else None
+        self.semantic_cache = None
+        if use_cache and LLM_SEMANTIC_CACHE:
+            if SEMANTIC_CACHE_AVAILABLE:
+                self.semantic_cache = SemanticCache(os.path.join(CACHE_DIR, "semantic"),
+                                                    threshold=LLM_SEMANTIC_THRESHOLD, ttl=LLM_CACHE_TTL)
+            else:
+                log.warning("LLM_SEMANTIC_CACHE is set but sentence-transformers/faiss-cpu are not installed; "
+                            "using the exact-match cache only")
+        # Set by the report writer thread when the document could not be built
+        self._report_error = None
+        # Shared by all projects for summary chunks; Ollama requests are capped
+        # at OLLAMA_CONCURRENCY anyway, and long-lived workers keep their sessions
+        self._chunk_executor = ThreadPoolExecutor(max_workers=OLLAMA_CONCURRENCY, thread_name_prefix="summary-chunk")
+        # Shared by all JIRA searches so page workers keep their pooled sessions
+        self._page_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="jira-page")
     
     @classmethod
     def from_env_projects(cls):
@@ -103,151 +529,389 @@ class JiraToDocxAutomation:
         Returns:
             List of issue dictionaries from JIRA API
         """
+        return self.fetch_issues_bulk([project_name])[project_name]
+    
+    def fetch_issues_bulk(self, project_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch issues for several projects with a single JQL query
+        
+        Uses `project in (...)` so all projects are retrieved in one round trip,
+        then groups the returned issues by project name or key, whichever was
+        requested. When every project has cached issues, only issues updated
+        since the oldest cache are requested and merged into the cached ones
+        by issue key; if JIRA confirms that result is unchanged since the last
+        run (ETag), the cached issues are used as they are. A keys-only run of
+        the full query then drops cached issues that no longer match it
+        (closed under a status filter, deleted, moved or aged out) and
+        fetches issues that newly match it without having been updated, for
+        example through endOfMonth() or openSprints(). If any
+        step of an incremental fetch fails, the cached issues are returned
+        unchanged rather than a partial result.
+        
+        Args:
+            project_names: Names or keys of the JIRA projects
+            
+        Returns:
+            Dictionary with project names as keys and lists of issue dictionaries as values
+        """
+        by_project = {project_name: [] for project_name in project_names}
+        # JQL matches project names and keys case-insensitively, so bucket the same way
+        lookup = {project_name.lower(): project_name for project_name in project_names}
+        
+        cached = {}
+        if self.issue_cache is not None:
+            cached = {project_name: self.issue_cache.load(project_name, JQL) for project_name in project_names}
+        cursor = None
+        if cached and all(cached.values()):
+            cursor = jql_cursor([entry["last_updated"] for entry in cached.values()])
+        incremental = cursor is not None
+        
         try:
-            headers = {
-                "Authorization": f"Bearer {JIRA_TOKEN}",
-                "Accept": "application/json",
-            }
+            project_list = ", ".join(f"'{project_name}'" for project_name in project_names)
+            full_jql = f"project in ({project_list}) {JQL}"
+            jql = f'({full_jql}) AND updated >= "{cursor}"' if incremental else full_jql
+            # Only the fields read by _process_issues, plus project for bucketing
+            fields = "issuetype,summary,status,priority,created,updated,duedate,project"
+            log.info("Fetching issues from JIRA with JQL: %s", jql)
+            etag = self.issue_cache.load_etag(jql) if incremental else None
+            issues, etag = self._search_issues(jql, fields, etag)
+            if issues is None:
+                log.info("JIRA reports no changes since the last run; using cached issues")
+                issues = []
+            else:
+                log.info("Successfully fetched %d issues from JIRA", len(issues))
             
-            params = {
-                "jql": f"project = '{project_name}' {JQL}",
-                "fields": "issuetype,key,summary,status,project,priority,assignee,reporter,created,updated,duedate",
-            }
-
-            print(f"Fetching issues from JIRA with JQL: project = '{project_name}' {JQL}")
-            response = requests.get(
-                "https://tracker.nci.nih.gov/rest/api/2/search", 
-                headers=headers, 
-                params=params,
-                timeout=30
-            )
+            live_keys = None
+            if incremental:
+                # Issues that stopped matching never show up in the delta, and
+                # neither do issues that started matching without an update,
+                # so the current set of matching keys is reconciled with both
+                live_keys = {issue["key"] for issue in self._search_issues(full_jql, "key")[0]}
+                known_keys = {issue["key"] for issue in issues}
+                for entry in cached.values():
+                    known_keys.update(entry["issues"])
+                missing_keys = sorted(live_keys - known_keys)
+                if missing_keys:
+                    log.info("Fetching %d issues that newly match the query", len(missing_keys))
+                for start in range(0, len(missing_keys), JQL_KEY_BATCH):
+                    key_list = ", ".join(missing_keys[start:start + JQL_KEY_BATCH])
+                    issues.extend(self._search_issues(f"key in ({key_list})", fields)[0])
             
-            if response.status_code != 200:
-                raise Exception(f"JIRA API error: {response.status_code} - {response.text}")
+            for issue in issues:
+                project = issue.get("fields", {}).get("project") or {}
+                project_name = lookup.get(project.get("name", "").lower()) or lookup.get(project.get("key", "").lower())
+                if project_name is not None:
+                    by_project[project_name].append(issue)
             
-            data = response.json()
-            issues = data.get("issues", [])
-            print(f"Successfully fetched {len(issues)} issues from JIRA")
-            return issues
+            if self.issue_cache is not None:
+                for project_name, project_issues in by_project.items():
+                    merged = {}
+                    if incremental:
+                        merged = {key: issue for key, issue in cached[project_name]["issues"].items()
+                                  if key in live_keys}
+                    merged.update((issue["key"], issue) for issue in project_issues)
+                    self.issue_cache.save(project_name, JQL, merged)
+                    by_project[project_name] = list(merged.values())
+                if incremental and etag:
+                    self.issue_cache.save_etag(jql, etag)
+            return by_project
             
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching issues from JIRA: {e}")
-            return []
+            log.error("Error fetching issues from JIRA: %s", e)
         except Exception as e:
-            print(f"Unexpected error: {e}")
-            return []
+            log.error("Unexpected error: %s", e)
+        
+        if incremental:
+            # by_project may hold only part of the delta; the cache is the
+            # last complete view
+            log.warning("Using cached issues from the previous run")
+            return {project_name: list(entry["issues"].values()) for project_name, entry in cached.items()}
+        return by_project
+    
+    def _search_issues(self, jql: str, fields: str,
+                       etag: Optional[str] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Run a JIRA search and collect every page of results
+        
+        Requests JIRA_PAGE_SIZE issues per page. If the server caps the page
+        size lower, the returned page length becomes the batch size. Once the
+        first page reveals the total, the remaining pages are fetched
+        concurrently. Issues repeated across pages are kept once.
+        
+        Args:
+            jql: JQL query to run
+            fields: Comma-separated list of issue fields to return
+            etag: ETag of a previous identical search; the first page is
+                requested conditionally
+            
+        Returns:
+            Tuple of all issue dictionaries matching the query (None if JIRA
+            answered 304 Not Modified) and the result's ETag. An ETag is only
+            returned when the whole result fit on the first page, since it
+            covers that page alone.
+            
+        Raises:
+            Exception: If JIRA responds with an error status
+        """
+        params = {
+            "jql": jql,
+            "fields": fields,
+            "startAt": 0,
+            "maxResults": JIRA_PAGE_SIZE,
+            # No renderedFields/names/schema expansions, and fields are
+            # addressed by key so the server skips name resolution
+            "expand": "",
+            "fieldsByKeys": "true",
+            # Unknown project names are skipped instead of failing the whole query
+            "validateQuery": "false",
+        }
+        
+        data, etag = self._search_page(params, etag)
+        if data is None:
+            return None, etag
+        issues = data.get("issues", [])
+        total = data.get("total", len(issues))
+        if not issues or len(issues) >= total:
+            return issues, etag
+        
+        if len(issues) < params["maxResults"]:
+            log.warning("JIRA returned %d issues per page instead of %d; using %d as the batch size",
+                        len(issues), params["maxResults"], len(issues))
+            params["maxResults"] = len(issues)
+        
+        # Results can shift between page requests, so the same issue may come
+        # back on two pages; offsets count what JIRA returned, not what is kept
+        fetched = len(issues)
+        seen_keys = {issue["key"] for issue in issues}
+        
+        def add_page(page: List[Dict[str, Any]]):
+            for issue in page:
+                if issue["key"] not in seen_keys:
+                    seen_keys.add(issue["key"])
+                    issues.append(issue)
+        
+        offsets = range(fetched, total, params["maxResults"])
+        pages = self._page_executor.map(lambda start: self._search_page({**params, "startAt": start})[0], offsets)
+        for start, page_data in zip(offsets, pages):
+            page = page_data.get("issues", [])
+            fetched += len(page)
+            add_page(page)
+            if start + len(page) < min(start + params["maxResults"], total):
+                # A short page means the offsets no longer line up;
+                # page through the rest sequentially
+                break
+        
+        while fetched < total:
+            page = self._search_page({**params, "startAt": fetched})[0].get("issues", [])
+            if not page:
+                break
+            fetched += len(page)
+            add_page(page)
+        
+        return issues, None
+    
+    def _search_page(self, params: Dict[str, Any],
+                     etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch a single page of JIRA search results
+        
+        Args:
+            params: Search query parameters, including startAt and maxResults
+            etag: ETag of a previous identical request, sent as If-None-Match
+            
+        Returns:
+            Tuple of the decoded search response (None if JIRA answered
+            304 Not Modified) and the response's ETag, if any
+            
+        Raises:
+            Exception: If JIRA responds with an error status
+        """
+        headers = self._jira_headers
+        if etag is not None:
+            headers = {**headers, "If-None-Match": etag}
+        response = _get_session().get(
+            "https://tracker.nci.nih.gov/rest/api/2/search", 
+            headers=headers, 
+            params=params,
+            timeout=30
+        )
+        
+        if response.status_code == 304:
+            return None, etag
+        if response.status_code != 200:
+            raise Exception(f"JIRA API error: {response.status_code} - {response.text}")
+        
+        log.debug("JIRA search page at %s: %d bytes (Content-Length: %s)", params["startAt"],
+                  len(response.content), response.headers.get("Content-Length", "n/a"))
+        return _json_loads(response.content), response.headers.get("ETag")
     
-    def summarize_with_ollama(self, text: str) -> str:
+    def summarize_with_ollama(self, text: str, project_name: str = "") -> str:
         """
         Generate AI summary using Ollama LLM
         
+        Issue lists longer than SUMMARY_CHUNK_CHARS are split into chunks
+        that are summarized concurrently on the shared chunk executor; the
+        partial summaries are then combined into one.
+        
         Args:
-            text: The text content to summarize
+            text: The text content to summarize, one issue per line
+            project_name: Project the issues belong to; semantic cache hits
+                are limited to the same project
             
         Returns:
             AI-generated summary text
         """
         try:
-            # Prepare the request body for Ollama API
-            body = {
-                "model": "llama3",
-                "prompt": (
-                    "You are a project manager assistant. Given a list of JIRA issues or tasks with the fields: "
-                    "Issue Type, Issue Key, Summary, and Status, create a concise and professional high-level summary "
-                    "of completed, planned for this specific project in the current or upcoming month. "
-                    "The overall summary should be limited to 150 words. "
-                    "Do not include any specific issue keys in your summary. "
-                    "Do not list individual issues. No explanation needed—just the summary.\n\n"
-                    f"Here is the list of issues for this project: {text}"
-                ),
-                "stream": False
-            }
-
-            headers = {"Content-Type": "application/json"}
+            lines = text.splitlines()
+            chunks = list(_chunk_lines(lines, SUMMARY_CHUNK_CHARS))
+            if len(chunks) <= 1:
+                return self._generate_summary(_SUMMARY_PROMPT_PREFIX + text, f"summary:{project_name}:{len(lines)}")
             
-            print("Generating summary with Ollama...")
-            response = requests.post(OLLAMA_URL, json=body, headers=headers)
-            
-            if response.status_code != 200:
-                print(f"Ollama API error: {response.status_code} - {response.text}")
-                return f"Error generating summary: {response.text}"
-            
-            result = response.json()
-            summary = result.get("response", "")
-            return summary.strip()
+            log.info("Summarizing %d chunks of issues...", len(chunks))
+            partials = list(self._chunk_executor.map(
+                lambda chunk: self._generate_summary(_SUMMARY_PROMPT_PREFIX + chunk,
+                                                     f"summary:{project_name}:{len(chunk.splitlines())}"),
+                chunks))
+            return self._generate_summary(_COMBINE_PROMPT_PREFIX + "\n---\n".join(partials),
+                                          f"combine:{project_name}:{len(partials)}")
             
         except requests.exceptions.RequestException as e:
-            print(f"Error connecting to Ollama: {e}")
+            log.error("Error connecting to Ollama: %s", e)
             return f"Error connecting to Ollama: {e}"
         except Exception as e:
-            print(f"Unexpected error during summarization: {e}")
+            log.error("Unexpected error during summarization: %s", e)
             return f"Error generating summary: {e}"
+    
+    def _generate_summary(self, prompt: str, scope: str = "") -> str:
+        """
+        Run a summary prompt through the response caches and Ollama
+        
+        Args:
+            prompt: Complete prompt text
+            scope: Semantic cache scope of the prompt
+            
+        Returns:
+            The summary text
+        """
+        cached = self._get_cached_response(OLLAMA_MODEL, prompt, scope)
+        if cached is not None:
+            log.info("Using cached Ollama summary")
+            return cached
+        
+        log.info("Generating summary with Ollama...")
+        summary = _ollama_generate(prompt, OLLAMA_MODEL)
+        self._store_cached_response(OLLAMA_MODEL, prompt, summary, scope)
+        return summary
 
 
-    def generate_word_document(self, projects_data: Dict[str, Dict], filename: str = "JIRA_Summary_Report.docx"):
+    def generate_word_document(self, projects_data: Dict[str, Dict], filename: Union[str, Path] = DEFAULT_REPORT_PATH,
+                               project_deliverables: Optional[Dict[str, List[Dict[str, str]]]] = None):
         """
         Generate comprehensive Word document with deliverables and project details
         
         Args:
             projects_data: Dictionary with project names as keys and project data as values
             filename: Output filename for the Word document
+            project_deliverables: Deliverables already extracted by extract_deliverables;
+                extracted here when not provided
         """
         try:
-            print(f"Generating Word document: {filename}")
-            
-            doc = Document()
+            log.info("Generating Word document: %s", filename)
             
-            # Add document title
-            title = doc.add_heading("Projects Monthly Status Report", 1)
-            title.alignment = 1  # Center alignment
+            doc, title = self._new_document()
             
             # Generate deliverable overview table at the beginning
-            project_deliverables = self.extract_deliverables(projects_data)
-            if project_deliverables:
-                self.generate_deliverable_table(doc, project_deliverables)
-                doc.add_page_break()
+            if project_deliverables is None:
+                project_deliverables = self.extract_deliverables(projects_data)
+            self._add_deliverable_overview(doc, title, project_deliverables)
             
             # Process each project section
-            for project_name, project_data in projects_data.items():
-                issues = project_data.get("issues", [])
-                project_summary = project_data.get("ai_summary", "No summary available")
-                
-                # Add project heading
-                doc.add_heading(f"{project_name}: Tasks completed or to be continued in the upcoming month.", 2)
-                
-                # Create issues table
-                issues_table = doc.add_table(rows=1, cols=4)
-                issues_table.style = 'Table Grid'
+            for index, (project_name, project_data) in enumerate(projects_data.items()):
+                self._add_project_section(doc, project_name, project_data, new_page=index > 0)
                 
-                # Set table headers
-                hdr_cells = issues_table.rows[0].cells
-                hdr_cells[0].text = 'Issue Type'
-                hdr_cells[1].text = 'Issue Key'
-                hdr_cells[2].text = 'Summary'
-                hdr_cells[3].text = 'Status'
-                
-                # Add issues to table
-                for issue in issues:
-                    row_cells = issues_table.add_row().cells
-                    row_cells[0].text = issue.get("issue type", "N/A")
-                    row_cells[1].text = issue.get("issue key", "No key")
-                    row_cells[2].text = issue.get("summary", "No summary")
-                    row_cells[3].text = issue.get("status", "No status")
-
-                # Add project summary section
-                doc.add_heading("Project Summary", level=3)
-                doc.add_paragraph(project_summary)
-                doc.add_page_break()
-                
-            # Save document with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename_with_timestamp = f"{filename.split('.')[0]}_{timestamp}.docx"
-            doc.save(filename_with_timestamp)
-            print(f"Document saved successfully as {filename_with_timestamp}")
+            self._save_document(doc, filename)
             
         except Exception as e:
-            print(f"Error generating Word document: {e}")
+            log.error("Error generating Word document: %s", e)
     
+    def _new_document(self):
+        """
+        Create the report document with its title
+        
+        Returns:
+            Tuple of the Document and the title paragraph
+        """
+        doc = Document()
+        
+        # Add document title
+        title = doc.add_heading("Projects Monthly Status Report", 1)
+        title.alignment = 1  # Center alignment
+        return doc, title
+    
+    def _add_deliverable_overview(self, doc: Document, anchor, project_deliverables: Dict[str, List[Dict[str, str]]]):
+        """
+        Add the deliverable overview directly after the anchor paragraph
+        
+        The overview is written at the end of the document and then moved, so
+        it can be added after the project sections have been written.
+        
+        Args:
+            doc: Document object to add the overview to
+            anchor: Paragraph the overview should follow (the document title)
+            project_deliverables: Dictionary with project names as keys and lists of deliverables as values
+        """
+        if not project_deliverables:
+            return
+        
+        body = doc.element.body
+        # New block content is inserted before the trailing sectPr
+        start = len(body) - 1
+        self.generate_deliverable_table(doc, project_deliverables)
+        doc.add_page_break()
+        
+        previous = anchor._p
+        for element in list(body)[start:-1]:
+            previous.addnext(element)
+            previous = element
+    
+    def _add_project_section(self, doc: Document, project_name: str, project_data: Dict, new_page: bool = False):
+        """
+        Append a project's issues table and AI summary to the document
+        
+        Args:
+            doc: Document object to add the section to
+            project_name: Name of the project
+            project_data: Dictionary containing project issues and data
+            new_page: Start the section on a new page; set for every section
+                but the first, so the report does not end with a blank page
+        """
+        columns = self._get_columns(project_data)
+        project_summary = project_data.get("ai_summary", "No summary available")
+        
+        if new_page:
+            doc.add_page_break()
+        
+        # Add project heading
+        doc.add_heading(f"{project_name}: Tasks completed or to be continued in the upcoming month.", 2)
+        
+        # Create issues table; the header and issue rows are built as XML in one pass
+        issues_table = doc.add_table(rows=0, cols=len(ISSUE_TABLE_HEADERS))
+        issues_table.style = 'Table Grid'
+        _append_table_rows(issues_table, chain((ISSUE_TABLE_HEADERS,), zip(
+            columns["issue type"], columns["issue key"], columns["summary"], columns["status"]
+        )))
+
+        # Add project summary section
+        doc.add_heading("Project Summary", level=3)
+        doc.add_paragraph(project_summary)
+    
+    def _save_document(self, doc: Document, filename: Union[str, Path]):
+        """Save the document under a timestamped variant of filename"""
+        path = Path(filename)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path_with_timestamp = path.with_stem(f"{path.stem}_{timestamp}").with_suffix(".docx")
+        doc.save(str(path_with_timestamp))
+        log.info("Document saved successfully as %s", path_with_timestamp)
 
     def extract_deliverables(self, projects_data: Dict[str, Dict]) -> Dict[str, List[Dict[str, str]]]:
         """
@@ -262,53 +926,82 @@ class JiraToDocxAutomation:
         Returns:
             Dictionary with project names as keys and lists of deliverable dictionaries as values
         """
-        print("Analyzing projects to extract deliverables using AI...")
+        log.info("Analyzing projects to extract deliverables using AI...")
         
-        project_deliverables = {}
+        if not projects_data:
+            return {}
         
-        # Process each project separately for better organization
-        for project_name, project_data in projects_data.items():
-            print(f"Extracting deliverables for project: {project_name}")
-            
-            issues = project_data.get("issues", [])
-            if not issues:
-                project_deliverables[project_name] = []
-                continue
-            
-            # Prepare project-specific data for AI analysis
-            project_issues = []
-            for issue in issues:
-                project_issues.append({
-                    "issue_type": issue.get("issue type", "Unknown"),
-                    "issue_key": issue.get("issue key", "No key"),
-                    "summary": issue.get("summary", "No summary"),
-                    "status": issue.get("status", "Unknown"),
-                    "due_date": issue.get("duedate", "No due date"),
-                    "updated": issue.get("updated", "Unknown")
-                })
+        # Each project is analyzed independently, so the Ollama calls can overlap
+        results = {}
+        max_workers = min(MAX_WORKERS, len(projects_data))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._extract_project_deliverables, project_name, project_data): project_name
+                for project_name, project_data in projects_data.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Preserve the original project ordering
+        return {project_name: results[project_name] for project_name in projects_data}
+    
+    def _extract_project_deliverables(self, project_name: str, project_data: Dict) -> List[Dict[str, str]]:
+        """Extract deliverables for a single project, falling back to rule-based extraction"""
+        log.info("Extracting deliverables for project: %s", project_name)
+        
+        columns = self._get_columns(project_data)
+        if not columns["issue key"]:
+            return []
+        
+        # Prepare project-specific data for AI analysis, keeping only the
+        # issues the prompt would let the model select
+        project_issues = [
+            {
+                "issue_type": issue_type,
+                "summary": summary,
+                "status": status,
+                "due_date": duedate,
+                "updated": updated
+            }
+            for issue_type, summary, status, updated, duedate in zip(
+                columns["issue type"], columns["summary"],
+                columns["status"], columns["updated"], columns["duedate"]
+            )
+            if _DELIVERABLE_TYPE_RE.search(issue_type or "") and _CLOSED_STATUS_RE.search(status or "")
+        ]
+        
+        if not project_issues:
+            log.info("No closed deliverable-type issues for %s, skipping AI analysis", project_name)
+            return []
+        
+        if len(project_issues) <= MAX_DELIVERABLES_WITHOUT_AI:
+            log.info("Only %d candidate deliverables for %s, skipping AI analysis", len(project_issues), project_name)
+            return [
+                self._issue_to_deliverable(project_name, issue["summary"], issue["due_date"],
+                                           issue["updated"], issue["status"])
+                for issue in project_issues
+            ]
+        
+        # Create project-specific AI analysis prompt
+        prompt = self._create_project_deliverable_prompt(project_name, project_issues)
+        
+        try:
+            # Call Ollama for AI analysis
+            response = self._call_ollama_for_deliverables(
+                prompt, f"deliverables:{project_name}:{len(project_issues)}")
             
-            # Create project-specific AI analysis prompt
-            prompt = self._create_project_deliverable_prompt(project_name, project_issues)
+            if response:
+                deliverables = self._parse_deliverable_response(response, project_name)
+                if deliverables:
+                    log.info("AI identified %d deliverables for %s", len(deliverables), project_name)
+                    return deliverables
             
-            try:
-                # Call Ollama for AI analysis
-                response = self._call_ollama_for_deliverables(prompt)
-                
-                if response:
-                    deliverables = self._parse_deliverable_response(response, project_name)
-                    if deliverables:
-                        print(f"AI identified {len(deliverables)} deliverables for {project_name}")
-                        project_deliverables[project_name] = deliverables
-                        continue
+            log.warning("AI analysis failed for %s, using fallback method", project_name)
+            return self._fallback_extract_project_deliverables(project_name, project_data)
                 
-                print(f"AI analysis failed for {project_name}, using fallback method")
-                project_deliverables[project_name] = self._fallback_extract_project_deliverables(project_name, project_data)
-                    
-            except Exception as e:
-                print(f"Error during AI deliverable extraction for {project_name}: {e}")
-                project_deliverables[project_name] = self._fallback_extract_project_deliverables(project_name, project_data)
-        
-        return project_deliverables
+        except Exception as e:
+            log.error("Error during AI deliverable extraction for %s: %s", project_name, e)
+            return self._fallback_extract_project_deliverables(project_name, project_data)
     
     def _create_project_deliverable_prompt(self, project_name: str, project_issues: List[Dict]) -> str:
         """Create the AI prompt for project-specific deliverable extraction"""
@@ -321,7 +1014,7 @@ A deliverable is typically:
 - Includes completed Stories, epics, tasks, or features (not bugs or sub-tasks).
 
 Here are the issues from project "{project_name}" to analyze:
-{json.dumps(project_issues, indent=2)}
+{_json_dumps(project_issues).decode("utf-8")}
 
 Please return ONLY a valid JSON array of deliverables in this exact format:
 [
@@ -335,64 +1028,75 @@ Please return ONLY a valid JSON array of deliverables in this exact format:
 
 """
     
-    def _call_ollama_for_deliverables(self, prompt: str) -> str:
+    def _call_ollama_for_deliverables(self, prompt: str, scope: str = "") -> str:
         """Call Ollama API for deliverable analysis"""
-        body = {
-            "model": "llama3",
-            "prompt": prompt,
-            "stream": False
-        }
-        headers = {"Content-Type": "application/json"}
+        cached = self._get_cached_response(OLLAMA_MODEL, prompt, scope)
+        if cached is not None:
+            log.info("Using cached Ollama deliverable analysis")
+            return cached
         
-        print("Requesting AI analysis of deliverables...")
-        response = requests.post(OLLAMA_URL, json=body, headers=headers)
+        log.info("Requesting AI analysis of deliverables...")
+        # The answer is a JSON array, so stop reading once it is complete
+        deliverables = _ollama_generate(prompt, OLLAMA_MODEL, stop_at_json_array=True)
+        self._store_cached_response(OLLAMA_MODEL, prompt, deliverables, scope)
+        return deliverables
+    
+    def _get_cached_response(self, model: str, prompt: str, scope: str = "") -> Optional[str]:
+        """
+        Return the cached Ollama response for a prompt, if any
         
-        if response.status_code != 200:
-            print(f"Ollama API error: {response.status_code} - {response.text}")
+        The exact-match cache is keyed by the prompt alone; semantic cache
+        hits additionally require the same scope (prompt kind, project and
+        item count).
+        """
+        if self.llm_cache is None:
             return None
-        
-        result = response.json()
-        return result.get("response", "").strip()
+        cached = self.llm_cache.get(model, prompt)
+        if cached is None and self.semantic_cache is not None:
+            cached = self.semantic_cache.get(model, prompt, scope)
+        return cached
+    
+    def _store_cached_response(self, model: str, prompt: str, response: str, scope: str = ""):
+        """Cache a successful Ollama response for a prompt"""
+        if self.llm_cache is not None and response:
+            self.llm_cache.set(model, prompt, response)
+        if self.semantic_cache is not None and response:
+            self.semantic_cache.set(model, prompt, response, scope)
     
     def _parse_deliverable_response(self, ai_response: str, project_name: str) -> List[Dict[str, str]]:
         """Parse AI response and extract deliverable JSON for a specific project"""
         try:
             # Clean up the response to extract JSON
-            json_start = ai_response.find('[')
-            json_end = ai_response.rfind(']') + 1
+            json_str = _extract_first_json_array(ai_response)
             
-            if json_start != -1 and json_end != -1:
-                json_str = ai_response[json_start:json_end]
-                deliverables = json.loads(json_str)
+            if json_str is not None:
+                deliverables = _json_loads(json_str)
                 
                 # Format dates and add project name to deliverables
                 for deliverable in deliverables:
-                    deliverable["subproject"] = JIRA_Project_Name_Mapping[project_name] if project_name in JIRA_Project_Name_Mapping else project_name,
+                    deliverable["subproject"] = JIRA_Project_Name_Mapping.get(project_name, project_name)
                     deliverable["due_date"] = self._format_date(deliverable.get("due_date", "No due date"))
                     deliverable["date_updated"] = self._format_date(deliverable.get("date_updated", "Unknown"))
                 
                 return deliverables
             else:
-                print(f"Could not find valid JSON in AI response for {project_name}")
+                log.warning("Could not find valid JSON in AI response for %s", project_name)
                 return []
                 
         except json.JSONDecodeError as e:
-            print(f"Error parsing AI JSON response for {project_name}: {e}")
-            print(f"AI Response: {ai_response[:500]}...")
+            log.warning("Error parsing AI JSON response for %s: %s", project_name, e)
+            log.debug("AI Response: %s...", ai_response[:500])
             return []
     
     @staticmethod
     def _format_date(date_str: str) -> str:
         """Format date string to a more readable format"""
-        if not date_str or date_str == "Unknown" or date_str == "No due date":
-            return date_str
-        try:
-            # Parse ISO format and return just the date part
-            if 'T' in date_str:
-                return date_str.split('T')[0]
-            return date_str
-        except:
+        if not date_str or not isinstance(date_str, str) or date_str in _DATE_SENTINELS:
             return date_str
+        # ISO dates and timestamps start with YYYY-MM-DD; keep just the date part
+        if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+            return date_str[:10]
+        return date_str
     
     def _fallback_extract_project_deliverables(self, project_name: str, project_data: Dict) -> List[Dict[str, str]]:
         """
@@ -405,29 +1109,30 @@ Please return ONLY a valid JSON array of deliverables in this exact format:
         Returns:
             List of deliverable dictionaries for the specific project
         """
-        print(f"Using fallback rule-based deliverable extraction for {project_name}...")
+        log.info("Using fallback rule-based deliverable extraction for %s...", project_name)
         
         deliverables = []
-        deliverable_keywords = ["story", "epic", "task", "deliverable", "feature"]
-        
-        issues = project_data.get("issues", [])
+        columns = self._get_columns(project_data)
         
-        for issue in issues:
-            issue_type = issue.get("issue type", "").lower()
-            status = issue.get("status", "")
-            
+        for issue_type, summary, status, updated, duedate in zip(
+            columns["issue type"], columns["summary"], columns["status"], columns["updated"], columns["duedate"]
+        ):
             # Filter for deliverable-type issues
-            if any(keyword in issue_type for keyword in deliverable_keywords):
-                deliverable = {
-                    "subproject": JIRA_Project_Name_Mapping[project_name] if project_name in JIRA_Project_Name_Mapping else project_name,
-                    "deliverable_name": issue.get("summary", "No summary"),
-                    "due_date": self._format_date(issue.get("duedate", "No due date")),
-                    "date_updated": self._format_date(issue.get("updated", "Unknown")),
-                    "status": status
-                }
-                deliverables.append(deliverable)
+            if _DELIV_RE.search(issue_type or ""):
+                deliverables.append(self._issue_to_deliverable(project_name, summary, duedate, updated, status))
         
         return deliverables
+    
+    def _issue_to_deliverable(self, project_name: str, summary: str, duedate: str,
+                              updated: str, status: str) -> Dict[str, str]:
+        """Build a deliverable dictionary directly from issue fields"""
+        return {
+            "subproject": JIRA_Project_Name_Mapping[project_name] if project_name in JIRA_Project_Name_Mapping else project_name,
+            "deliverable_name": summary,
+            "due_date": self._format_date(duedate),
+            "date_updated": self._format_date(updated),
+            "status": status
+        }
 
     def generate_deliverable_table(self, doc: Document, project_deliverables: Dict[str, List[Dict[str, str]]]):
         """
@@ -446,7 +1151,7 @@ Please return ONLY a valid JSON array of deliverables in this exact format:
         # Add deliverable section heading
         doc.add_heading("Deliverables Overview", 2)
         
-        print(f"Generating deliverable table with {total_deliverables} deliverables...")
+        log.info("Generating deliverable table with %d deliverables...", total_deliverables)
         # Process each project's deliverables
         for project_name, deliverables in project_deliverables.items():
             if not deliverables:
@@ -456,27 +1161,26 @@ Please return ONLY a valid JSON array of deliverables in this exact format:
             doc.add_heading(f"{project_name} Deliverables", 3)
             
             # Create deliverable table for this project
-            deliverable_table = doc.add_table(rows=1, cols=5)
+            deliverable_table = doc.add_table(rows=0, cols=len(DELIVERABLE_TABLE_HEADERS))
             deliverable_table.style = 'Table Grid'
-            
-            # Set table headers (no need for subproject column since it's organized by project)
-            hdr_cells = deliverable_table.rows[0].cells
-            headers = ["Subproject", "Deliverable Name", "Due Date", "Date Updated", "Status"]
-            for i, header in enumerate(headers):
-                hdr_cells[i].text = header
+            _append_table_rows(deliverable_table, (DELIVERABLE_TABLE_HEADERS,))
             
             # Add deliverables to table
             if deliverables and isinstance(deliverables, list):
+                subproject = JIRA_Project_Name_Mapping.get(project_name, project_name)
+                rows = []
                 for deliverable in deliverables:
-                    print(f"Adding deliverable to table: {deliverable}")
-                    row_cells = deliverable_table.add_row().cells
-                    row_cells[0].text = JIRA_Project_Name_Mapping[project_name] if project_name in JIRA_Project_Name_Mapping else project_name,
-                    row_cells[1].text = str(deliverable.get("deliverable_name", "No name"))
-                    row_cells[2].text = str(deliverable.get("due_date", "No due date"))
-                    row_cells[3].text = str(deliverable.get("date_updated", "Unknown"))
-                    row_cells[4].text = str(deliverable.get("status", "No status"))
+                    log.debug("Adding deliverable to table: %s", deliverable)
+                    rows.append([
+                        subproject,
+                        deliverable.get("deliverable_name", "No name"),
+                        deliverable.get("due_date", "No due date"),
+                        deliverable.get("date_updated", "Unknown"),
+                        deliverable.get("status", "No status"),
+                    ])
+                _append_table_rows(deliverable_table, rows)
             else:
-                print(f"No valid deliverables found for project: {project_name}")
+                log.warning("No valid deliverables found for project: %s", project_name)
             
             doc.add_paragraph()  # Add spacing after each project's table
 
@@ -485,100 +1189,206 @@ Please return ONLY a valid JSON array of deliverables in this exact format:
         Main execution method for processing multiple projects
         
         Orchestrates the complete workflow:
-        1. Fetches issues from JIRA for each project
+        1. Fetches issues from JIRA for all projects in one query
         2. Processes and formats issue data
         3. Generates AI summaries for each project
         4. Extracts deliverables using AI analysis
-        5. Creates comprehensive Word document report
+        5. Creates comprehensive Word document report, writing each
+           project's section while the remaining projects are processed
         """
-        print("Starting JIRA to DOCX automation for multiple projects...")
-        print("=" * 60)
+        log.info("Starting JIRA to DOCX automation for multiple projects...")
         
-        projects_data = {}
+        # Step 1: Fetch issues for every project in one JIRA query
+        issues_by_project = self.fetch_issues_bulk(self.project_names)
         
-        # Process each project
-        for project_name in self.project_names:
-            print(f"\nProcessing project: {project_name}")
-            print("-" * 40)
-            
-            # Step 1: Fetch issues from JIRA
-            issues = self.fetch_issues(project_name)
-            if not issues:
-                print(f"No issues found for project {project_name}")
-                projects_data[project_name] = {
-                    "issues": [],
-                    "ai_summary": f"No issues found for project {project_name}"
-                }
-                continue
+        # A single writer thread owns the Document (python-docx is not
+        # thread-safe) and adds each project's section as soon as it is ready.
+        # A thread rather than a worker process: the Document and its lxml
+        # tree cannot be pickled, and the workers spend their time waiting on
+        # JIRA/Ollama, so the writer does not compete with them for the GIL
+        sections = queue.Queue()
+        self._report_error = None
+        writer = threading.Thread(target=self._write_report, args=(sections,), name="report-writer")
+        writer.start()
+        
+        # Summarize projects and extract deliverables concurrently; the work is LLM-bound
+        completed = False
+        try:
+            max_workers = max(1, min(MAX_WORKERS, len(self.project_names)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._process_project, project_name, issues_by_project[project_name])
+                    for project_name in self.project_names
+                ]
+                for future in as_completed(futures):
+                    sections.put(future.result())
+            completed = True
+        finally:
+            sections.put(_REPORT_DONE if completed else _REPORT_ABORTED)
+            writer.join()
+            if self.semantic_cache is not None:
+                self.semantic_cache.flush()
+        
+        if self._report_error is not None:
+            raise RuntimeError("Report generation failed") from self._report_error
+    
+    def _write_report(self, sections: queue.Queue, filename: Union[str, Path] = DEFAULT_REPORT_PATH):
+        """
+        Consume finished projects from the queue and build the Word document
+        
+        Sections are written in the configured project order: a project that
+        finishes early waits until all projects before it have been written.
+        The deliverable overview is inserted after the title once every
+        project is done.
+        
+        Errors are logged and kept in self._report_error for run() to raise.
+        
+        Args:
+            sections: Queue of (project_name, project_data) tuples, terminated
+                by _REPORT_DONE or _REPORT_ABORTED
+            filename: Output filename for the Word document
+        """
+        try:
+            log.info("Generating Word document: %s", filename)
             
-            # Step 2: Process and format issue data
-            issue_summaries = self._process_issues(issues)
+            doc, title = self._new_document()
+            positions = {project_name: index for index, project_name in enumerate(self.project_names)}
+            pending = {}
+            projects_data = {}
+            next_position = 0
             
-            # Step 3: Generate AI summary for this project
-            issues_string = self._format_issues_for_summary(issue_summaries)
-            print(f"\nGenerating AI summary for {project_name}...")
-            ai_summary = self.summarize_with_ollama(issues_string)
-            print(f"AI Summary for {project_name}:\n{ai_summary}")
+            while True:
+                item = sections.get()
+                if item is _REPORT_ABORTED:
+                    log.error("Report generation aborted; no document was saved")
+                    return
+                if item is _REPORT_DONE:
+                    break
+                
+                project_name, project_data = item
+                pending[positions[project_name]] = item
+                while next_position in pending:
+                    project_name, project_data = pending.pop(next_position)
+                    self._add_project_section(doc, project_name, project_data, new_page=next_position > 0)
+                    projects_data[project_name] = project_data
+                    next_position += 1
+        except Exception as e:
+            log.error("Error generating Word document: %s", e)
+            self._report_error = e
+            # The sentinel has not been read yet; consume the remaining
+            # sections up to it so nothing is left behind in the queue
+            while sections.get() not in (_REPORT_DONE, _REPORT_ABORTED):
+                pass
+            return
+        
+        # Past the sentinel: nothing more will arrive, so errors must not drain
+        try:
+            project_deliverables = {
+                project_name: project_data["deliverables"] for project_name, project_data in projects_data.items()
+            }
+            self._add_deliverable_overview(doc, title, project_deliverables)
+            self._save_document(doc, filename)
+            self._log_report_summary(projects_data, project_deliverables)
+        except Exception as e:
+            log.error("Error generating Word document: %s", e)
+            self._report_error = e
+    
+    def _process_project(self, project_name: str, issues: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Process, summarize and extract deliverables for a single project
+        
+        Args:
+            project_name: Name of the JIRA project
+            issues: Raw JIRA issues fetched for the project
             
-            # Store project data
-            projects_data[project_name] = {
-                "issues": issue_summaries,
-                "ai_summary": ai_summary
+        Returns:
+            Tuple of the project name and its data (issues, AI summary and deliverables)
+        """
+        log.info("Processing project: %s", project_name)
+        
+        if not issues:
+            log.info("No issues found for project %s", project_name)
+            return project_name, {
+                "issues": [],
+                "columns": _issue_columns([]),
+                "ai_summary": f"No issues found for project {project_name}",
+                "deliverables": []
             }
         
-        # Step 4: Generate comprehensive Word document
-        self._generate_final_report(projects_data)
+        # Step 2: Process and format issue data
+        issue_summaries, columns, issues_string = self._process_issues(issues)
+        
+        # Step 3: Generate AI summary for this project
+        log.info("Generating AI summary for %s...", project_name)
+        ai_summary = self.summarize_with_ollama(issues_string, project_name)
+        log.info("AI Summary for %s:\n%s", project_name, ai_summary)
         
-    def _process_issues(self, issues: List[Dict]) -> List[Dict[str, str]]:
-        """Process raw JIRA issues into formatted data"""
+        project_data = {
+            "issues": issue_summaries,
+            "columns": columns,
+            "ai_summary": ai_summary
+        }
+        
+        # Step 4: Extract deliverables using AI analysis
+        project_data["deliverables"] = self._extract_project_deliverables(project_name, project_data)
+        return project_name, project_data
+        
+    def _process_issues(self, issues: List[Dict]) -> Tuple[List[Dict[str, str]], Dict[str, List[Any]], str]:
+        """
+        Process raw JIRA issues into formatted data
+        
+        Every returned dictionary has all ISSUE_KEYS keys, so downstream
+        stages read them positionally instead of with per-field defaults.
+        The summary prompt lines are formatted in the same pass; each issue
+        key appears once, and only the SUMMARY_MAX_ISSUES most recently
+        updated issues are kept.
+        
+        Returns:
+            Tuple of the issue dictionaries, the same data as one list per key,
+            and the issues formatted for the summary prompt
+        """
         issue_summaries = []
+        summary_lines = []
+        seen_keys = set()
         
-        for issue in issues:
-            fields = issue.get("fields", {})
-            issue_data = {
-                "issue type": fields.get("issuetype", {}).get("name", "Unknown"),
-                "issue key": issue.get("key", "No key"),
-                "summary": fields.get("summary", "No summary"),
-                "status": fields.get("status", {}).get("name", "Unknown"),
-                "created": fields.get("created", "Unknown"),
-                "updated": fields.get("updated", "Unknown"),
-                "duedate": fields.get("duedate", "No due date"),
-                "priority": fields.get("priority", {}).get("name", "None"),
-            }
+        for issue_data in map(_extract_issue, issues):
             issue_summaries.append(issue_data)
+            key = issue_data["issue key"]
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            updated = issue_data["updated"]
+            # JIRA timestamps sort chronologically as strings; placeholders rank last
+            recency = updated if isinstance(updated, str) and updated[:1].isdigit() else ""
+            summary_lines.append((recency, _ISSUE_TMPL(*_SUMMARY_FIELDS(issue_data))))
         
-        return issue_summaries
+        if len(summary_lines) > SUMMARY_MAX_ISSUES:
+            log.info("Summarizing the %d most recently updated of %d issues", SUMMARY_MAX_ISSUES, len(summary_lines))
+            summary_lines = heapq.nlargest(SUMMARY_MAX_ISSUES, summary_lines, key=itemgetter(0))
+        
+        return issue_summaries, _issue_columns(issue_summaries), "\n".join(map(itemgetter(1), summary_lines))
     
-    def _format_issues_for_summary(self, issue_summaries: List[Dict]) -> str:
-        """Format issue data for AI summary generation"""
-        return "\n".join([
-            f"Issue Key: {issue['issue key']}, Summary: {issue['summary']}, "
-            f"Status: {issue['status']}, Created: {issue['created']}, "
-            f"Updated: {issue['updated']}, Due Date: {issue['duedate']}, "
-            f"Priority: {issue['priority']}"
-            for issue in issue_summaries
-        ])
+    @staticmethod
+    def _get_columns(project_data: Dict) -> Dict[str, List[Any]]:
+        """Return the columnar issue view of a project, building it if missing"""
+        columns = project_data.get("columns")
+        if columns is None:
+            columns = _issue_columns(project_data.get("issues", []))
+        return columns
     
-    def _generate_final_report(self, projects_data: Dict[str, Dict]):
-        """Generate the final Word document report"""
-        print(f"\n{'='*60}")
-        print("Generating combined Word document for all projects...")
-        
+    def _log_report_summary(self, projects_data: Dict[str, Dict], project_deliverables: Dict[str, List[Dict[str, str]]]):
+        """Log totals for the generated report"""
         total_issues = sum(len(project_data["issues"]) for project_data in projects_data.values())
-        project_deliverables = self.extract_deliverables(projects_data)
         total_deliverables = sum(len(deliverables) for deliverables in project_deliverables.values())
         
-        self.generate_word_document(projects_data)
-
-        print(f"\n{'='*60}")
-        print("Automation completed successfully!")
-        print(f"Generated report for {len(projects_data)} projects with {total_issues} total issues.")
-        print(f"Identified {total_deliverables} deliverables across all projects.")
+        log.info("Automation completed successfully!")
+        log.info("Generated report for %d projects with %d total issues.", len(projects_data), total_issues)
+        log.info("Identified %d deliverables across all projects.", total_deliverables)
         
         # Show deliverables breakdown by project
         for project_name, deliverables in project_deliverables.items():
             if deliverables:
-                print(f"  - {project_name}: {len(deliverables)} deliverables")
+                log.info("  - %s: %d deliverables", project_name, len(deliverables))
     
  
 def main():
@@ -588,15 +1398,24 @@ def main():
     Initializes the automation system and handles configuration validation
     and error reporting for common setup issues.
     """
+    parser = argparse.ArgumentParser(description="Generate a JIRA status report as a Word document")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached Ollama responses and JIRA issues")
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    
     try:
         project_names = JiraToDocxAutomation.from_env_projects()
-        print(f"Project names loaded: {project_names}")
+        log.info("Project names loaded: %s", project_names)
         
-        automation = JiraToDocxAutomation(project_names)
+        automation = JiraToDocxAutomation(project_names, use_cache=not args.no_cache)
         automation.run()
         
     except Exception as e:
-        print(f"Error: {e}")
+        log.error("Error: %s", e)
         print("\nPlease ensure:")
         print("1. Your .env file is properly configured")
         print("2. Ollama is running locally with llama3 model")
@@ -0,0 +1,235 @@
+"""
+Persistent prompt caches for Ollama responses
+
+PromptCache stores LLM responses in a local SQLite database keyed by the
+SHA-256 of the model name and prompt, so re-running the automation on an
+unchanged JIRA snapshot returns summaries without regenerating them.
+
+SemanticCache is an optional second tier that reuses a response when a new
+prompt for the same scope (e.g. project and issue count) is nearly identical
+to a cached one. It requires the sentence-transformers and faiss-cpu packages.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jira_automation")
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, "llm_cache.sqlite3")
+DEFAULT_TTL = 7 * 86400  # seconds
+
+DEFAULT_SEMANTIC_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, "semantic")
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_SIMILARITY_THRESHOLD = 0.93
+DEFAULT_MAX_ENTRIES = 2000
+
+# The embedding model truncates its input (256 word pieces for MiniLM), so
+# prompts are embedded in windows of this many characters and mean-pooled
+EMBED_WINDOW_CHARS = 512
+# Nearest neighbours checked for one with a matching model and scope
+SEARCH_K = 8
+
+
+class PromptCache:
+    """
+    SQLite-backed cache of LLM responses
+
+    The connection is shared between worker threads, so every access is
+    serialized through a lock.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: Location of the SQLite database file
+            ttl: Seconds a cached response stays valid
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Return the cache key for a model/prompt pair"""
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        key = self.make_key(model, prompt)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, model: str, prompt: str, response: str):
+        """Store a response for a model/prompt pair"""
+        key = self.make_key(model, prompt)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires) VALUES (?, ?, ?)",
+                (key, response, time.time() + self.ttl),
+            )
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticCache:
+    """
+    Embedding-based cache of LLM responses
+
+    Prompts are embedded with a sentence-transformers model and stored in a
+    FAISS inner-product index over L2-normalized vectors, so the search score
+    is the cosine similarity. A cached response is reused when a prompt for
+    the same model and scope scores at or above the threshold and has not
+    expired.
+
+    New entries are kept in memory until flush() is called.
+    """
+
+    def __init__(self, path: str = DEFAULT_SEMANTIC_CACHE_PATH,
+                 threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 model_name: str = DEFAULT_EMBEDDING_MODEL,
+                 ttl: int = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Load the embedding model and any previously persisted index
+
+        Args:
+            path: Directory holding the persisted index and responses
+            threshold: Minimum cosine similarity for a cache hit
+            model_name: sentence-transformers model used for embeddings
+            ttl: Seconds a cached response stays valid
+            max_entries: Entries kept; the oldest are dropped beyond this
+
+        Raises:
+            RuntimeError: If sentence-transformers or faiss is not installed
+        """
+        if not SEMANTIC_CACHE_AVAILABLE:
+            raise RuntimeError("Semantic cache requires sentence-transformers and faiss-cpu")
+
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._index_path = os.path.join(path, "index.faiss")
+        self._entries_path = os.path.join(path, "entries.json")
+        self._encoder = SentenceTransformer(model_name)
+        os.makedirs(path, exist_ok=True)
+
+        # Entries are [model, scope, response, expires], aligned with the index ids
+        self._entries: List[list] = []
+        self._index = faiss.IndexFlatIP(self._encoder.get_sentence_embedding_dimension())
+        if os.path.exists(self._index_path) and os.path.exists(self._entries_path):
+            with open(self._entries_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            # Files written by older versions lack scope and expiry; start over
+            if all(len(entry) == 4 for entry in entries):
+                self._index = faiss.read_index(self._index_path)
+                self._entries = entries
+                with self._lock:
+                    self._prune()
+
+    def _embed(self, prompt: str):
+        """
+        Return the normalized embedding of a whole prompt as a 1 x d float32 array
+
+        The prompt is split into windows the model can see in full; the window
+        embeddings are averaged and re-normalized.
+        """
+        windows = [prompt[i:i + EMBED_WINDOW_CHARS] for i in range(0, len(prompt), EMBED_WINDOW_CHARS)] or [""]
+        vectors = self._encoder.encode(windows, normalize_embeddings=True)
+        pooled = vectors.mean(axis=0, keepdims=True)
+        return (pooled / np.linalg.norm(pooled)).astype("float32")
+
+    def _prune(self):
+        """Drop expired entries and the oldest beyond max_entries; caller holds the lock"""
+        now = time.time()
+        keep = [i for i, entry in enumerate(self._entries) if entry[3] >= now][-self.max_entries:]
+        if len(keep) == len(self._entries):
+            return
+        vectors = self._index.reconstruct_n(0, self._index.ntotal)[keep]
+        self._index.reset()
+        if keep:
+            self._index.add(vectors)
+        self._entries = [self._entries[i] for i in keep]
+        self._dirty = True
+
+    def get(self, model: str, prompt: str, scope: str = "") -> Optional[str]:
+        """
+        Look up the response of the most similar cached prompt
+
+        Args:
+            model: Model the response must have been generated with
+            prompt: Prompt text
+            scope: Exact-match context the cached prompt must share, such as
+                prompt kind, project and issue count
+
+        Returns:
+            The cached response, or None if no prompt is similar enough
+        """
+        embedding = self._embed(prompt)
+        with self._lock:
+            if self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(embedding, min(SEARCH_K, self._index.ntotal))
+            now = time.time()
+            for score, idx in zip(scores[0], ids[0]):
+                # Results are ordered by decreasing similarity
+                if idx < 0 or score < self.threshold:
+                    break
+                cached_model, cached_scope, response, expires = self._entries[idx]
+                if cached_model == model and cached_scope == scope and expires >= now:
+                    return response
+        return None
+
+    def set(self, model: str, prompt: str, response: str, scope: str = ""):
+        """Add a prompt/response pair to the in-memory index"""
+        embedding = self._embed(prompt)
+        with self._lock:
+            self._index.add(embedding)
+            self._entries.append([model, scope, response, time.time() + self.ttl])
+            self._dirty = True
+            if len(self._entries) > self.max_entries:
+                self._prune()
+
+    def flush(self):
+        """Persist the index and responses if they changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            faiss.write_index(self._index, self._index_path)
+            with open(self._entries_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            self._dirty = False
@@ -5,15 +5,55 @@ Test script to verify JIRA and Ollama connectivity
 
 import os
 import requests
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+# Shared by all checks so the JIRA connection is only set up once
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings read from the environment / .env file"""
+    jira_token: Optional[str]
+    jira_url: Optional[str]
+    jql: Optional[str]
+
+    @property
+    def jira_headers(self) -> Dict[str, str]:
+        """Headers for authenticated JIRA requests"""
+        return {
+            "Authorization": f"Bearer {self.jira_token}",
+            "Accept": "application/json"
+        }
+
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Load the .env file once and return the resulting settings"""
+    load_dotenv()
+    return Config(
+        jira_token=os.getenv("JIRA_TOKEN"),
+        jira_url=os.getenv("JIRA_URL"),
+        jql=os.getenv("JIRA_JQL"),
+    )
+
+
 def test_environment():
     """Test if environment variables are properly set"""
-    load_dotenv()
-    
-    jira_token = os.getenv("JIRA_TOKEN")
-    jira_url = os.getenv("JIRA_URL")
-    jql = os.getenv("JIRA_JQL")
+    config = _config()
+    jira_token, jira_url, jql = config.jira_token, config.jira_url, config.jql
     
     print("🔍 Testing Environment Configuration...")
     
@@ -39,23 +79,15 @@ def test_environment():
 
 def test_jira_connection():
     """Test JIRA API connectivity"""
-    load_dotenv()
-    
-    jira_token = os.getenv("JIRA_TOKEN")
-    jira_url = os.getenv("JIRA_URL")
+    config = _config()
     
     print("\n🔗 Testing JIRA Connection...")
     
     try:
-        headers = {
-            "Authorization": f"Bearer {jira_token}",
-            "Accept": "application/json"
-        }
-        
         # Test with /myself endpoint
-        response = requests.get(
-            f"{jira_url}/rest/api/3/myself",
-            headers=headers,
+        response = _SESSION.get(
+            f"{config.jira_url}/rest/api/3/myself",
+            headers=config.jira_headers,
             timeout=10
         )
         
@@ -88,7 +120,7 @@ def test_ollama_connection():
             "stream": False
         }
         
-        response = requests.post(
+        response = _SESSION.post(
             "http://localhost:11434/api/generate",
             json=body,
             timeout=30
@@ -113,29 +145,20 @@ def test_ollama_connection():
 
 def test_jira_query():
     """Test JIRA JQL query"""
-    load_dotenv()
-    
-    jira_token = os.getenv("JIRA_TOKEN")
-    jira_url = os.getenv("JIRA_URL")
-    jql = os.getenv("JIRA_JQL")
+    config = _config()
     
-    print(f"\n📋 Testing JIRA Query: {jql}")
+    print(f"\n📋 Testing JIRA Query: {config.jql}")
     
     try:
-        headers = {
-            "Authorization": f"Bearer {jira_token}",
-            "Accept": "application/json"
-        }
-        
         params = {
-            "jql": jql,
+            "jql": config.jql,
             "maxResults": 5,
             "fields": "summary,status"
         }
         
-        response = requests.get(
-            f"{jira_url}/rest/api/3/search",
-            headers=headers,
+        response = _SESSION.get(
+            f"{config.jira_url}/rest/api/3/search",
+            headers=config.jira_headers,
             params=params,
             timeout=10
         )
@@ -4,9 +4,16 @@ Configuration validator for JIRA to DOCX automation
 """
 
 import os
+import re
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+# Required .env assignments, captured as (key, value) in one pass over the file
+# (python-dotenv also accepts an "export " prefix)
+_ENV_RE = re.compile(rb"^[ \t]*(?:export[ \t]+)?(JIRA_TOKEN|JIRA_URL|JIRA_JQL)[ \t]*=[ \t]*(.*?)[ \t]*\r?$",
+                     re.MULTILINE)
+
 def check_files():
     """Check if all required files exist"""
     required_files = [
@@ -37,24 +44,24 @@ def check_env_file():
         return False
     
     try:
-        with open('.env', 'r') as f:
-            content = f.read()
+        with open('.env', 'rb') as f:
+            env = dict(_ENV_RE.findall(f.read()))
         
         issues = []
         
-        if 'your_token_here' in content:
+        if b'your_token_here' in env.get(b'JIRA_TOKEN', b''):
             issues.append("JIRA_TOKEN still contains placeholder value")
         
-        if 'yourdomain' in content:
+        if b'yourdomain' in env.get(b'JIRA_URL', b''):
             issues.append("JIRA_URL still contains placeholder domain")
         
-        if 'JIRA_TOKEN=' not in content:
+        if b'JIRA_TOKEN' not in env:
             issues.append("JIRA_TOKEN not defined")
         
-        if 'JIRA_URL=' not in content:
+        if b'JIRA_URL' not in env:
             issues.append("JIRA_URL not defined")
         
-        if 'JIRA_JQL=' not in content:
+        if b'JIRA_JQL' not in env:
             issues.append("JIRA_JQL not defined")
         
         if issues:
@@ -95,17 +102,11 @@ def check_dependencies():
     all_available = True
     
     for package, description in packages.items():
-        try:
-            if package == 'docx':
-                # python-docx imports as 'docx'
-                __import__('docx')
-            elif package == 'dotenv':
-                # python-dotenv imports as 'dotenv'
-                __import__('dotenv')
-            else:
-                __import__(package)
+        # Keys are import names (python-docx imports as 'docx', python-dotenv
+        # as 'dotenv'); find_spec locates them without executing the module
+        if find_spec(package) is not None:
             print(f"✅ {package} - {description}")
-        except ImportError:
+        else:
             print(f"❌ {package} - {description} - NOT INSTALLED")
             all_available = False
     